@@ -75,7 +75,7 @@ def any_of(*patterns):
         """
         raise STRlingError(message)
 
-    sub_names = named_group_counts.keys()
+    sub_names = tuple(named_group_counts)
 
     joined = '|'.join(str(p) for p in clean_patterns)
     new_pattern = f'(?:{joined})'
@@ -143,7 +143,7 @@ def may(*patterns):
         """
         raise STRlingError(message)
 
-    sub_names = named_group_counts.keys()
+    sub_names = tuple(named_group_counts)
 
     joined = merge(*clean_patterns)
     new_pattern = f'{joined}?'
@@ -211,7 +211,7 @@ def merge(*patterns):
         """
         raise STRlingError(message)
 
-    sub_names = named_group_counts.keys()
+    sub_names = tuple(named_group_counts)
 
     joined = ''.join(str(p) for p in clean_patterns)
     new_pattern = f'(?:{joined})'
@@ -308,7 +308,7 @@ def capture(*patterns):
         """
         raise STRlingError(message)
 
-    sub_names = named_group_counts.keys()
+    sub_names = tuple(named_group_counts)
 
     joined = ''.join(str(p) for p in clean_patterns)
     new_pattern = f'({joined})'
@@ -413,9 +413,9 @@ def group(name, *patterns):
         """
         raise STRlingError(message)
 
-    sub_names = named_group_counts.keys()
+    sub_names = tuple(named_group_counts)
 
     joined = ''.join(str(p) for p in clean_patterns)
     new_pattern = f'(?P<{name}>{joined})'
 
-    return Pattern(new_pattern, composite=True, named_groups=[name, *sub_names])
+    return Pattern(new_pattern, composite=True, named_groups=(name, *sub_names))
@@ -0,0 +1,1379 @@
+import abc, array, bisect, functools, re, sys
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse, sre_constants
+
+
+
+############################
+# Engine Limits
+########
+
+# The largest codepoint a Python string can hold.
+MAX_CHAR = 0x10FFFF
+
+# Patterns expanding into more NFA states are left to the `re` engine.
+MAX_NFA_STATES = 20000
+
+# Patterns whose DFA table has more cells (states times alphabet classes) are built lazily instead.
+MAX_DFA_CELLS = 1 << 17
+
+# Patterns whose DFA states hold more NFA states in total are built lazily instead,
+# since the subset construction pays a closure over each of them.
+MAX_SUBSET_STATES = 1 << 15
+
+# Candidate matches a search follows at once. Past this, it stops starting new candidates
+# and resumes after the last one started if none of them matches.
+MAX_SEARCH_LAYERS = 8
+
+# Approximate memory a matcher may spend on cached states, transitions and characters.
+CACHE_BYTES = 1 << 20
+
+# Compiled matchers kept by `compile_dfa`, each within `CACHE_BYTES` plus its table.
+CACHED_MATCHERS = 16
+
+# Approximate memory of one cached transition.
+_TRANSITION_BYTES = 120
+
+# Approximate memory of one character cached with its alphabet class.
+_CLASS_BYTES = 100
+
+# Final flags stored per DFA state.
+ACCEPTS = 1              # Accepts wherever it stands.
+ACCEPTS_AT_END = 2       # Accepts at the end of the text.
+ACCEPTS_BEFORE_NEWLINE = 4  # Accepts before a newline ending the text.
+ACCEPTS_EMPTY_TEXT = 8   # Accepts an empty text, as the start state at the beginning.
+ACCEPTS_NEWLINE_TEXT = 16   # Accepts before a text that is a single newline, as the start state at the beginning.
+
+# The assertion kinds the automata can resolve.
+_BEGIN, _END, _EOL, _BOUNDARY, _NOT_BOUNDARY = 'begin', 'end', 'eol', 'boundary', 'not_boundary'
+
+_ASSERTIONS = {
+    sre_constants.AT_BEGINNING: _BEGIN,
+    sre_constants.AT_BEGINNING_STRING: _BEGIN,
+    sre_constants.AT_END: _EOL,
+    sre_constants.AT_END_STRING: _END,
+    sre_constants.AT_BOUNDARY: _BOUNDARY,
+    sre_constants.AT_NON_BOUNDARY: _NOT_BOUNDARY,
+}
+
+# Readable names of the constructs the automata cannot represent.
+_UNSUPPORTED = {
+    sre_constants.ASSERT: 'lookarounds',
+    sre_constants.ASSERT_NOT: 'lookarounds',
+    sre_constants.GROUPREF: 'backreferences',
+    sre_constants.GROUPREF_EXISTS: 'conditional groups',
+    sre_constants.MIN_REPEAT: 'lazy repetition',
+}
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: (r'\d', False),
+    sre_constants.CATEGORY_NOT_DIGIT: (r'\d', True),
+    sre_constants.CATEGORY_SPACE: (r'\s', False),
+    sre_constants.CATEGORY_NOT_SPACE: (r'\s', True),
+    sre_constants.CATEGORY_WORD: (r'\w', False),
+    sre_constants.CATEGORY_NOT_WORD: (r'\w', True),
+}
+
+
+
+############################
+# Unsupported Patterns
+########
+
+class EngineUnsupported(Exception):
+    """
+    Raised when a pattern uses a feature the automata cannot represent.
+
+    Attributes:
+        - reason (str): A short description of the unsupported feature.
+    """
+    def __init__(self, reason):
+        self.reason = reason
+        super().__init__(reason)
+
+
+
+############################
+# Character Intervals
+########
+
+def _union(intervals):
+    """
+    Merges overlapping or touching (lo, hi) codepoint intervals.
+    """
+    merged = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            if hi > merged[-1][1]:
+                merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+    return tuple(merged)
+
+def _complement(intervals):
+    """
+    Returns every codepoint not covered by the merged intervals.
+    """
+    result = []
+    prev = 0
+    for lo, hi in intervals:
+        if lo > prev:
+            result.append((prev, lo - 1))
+        prev = hi + 1
+    if prev <= MAX_CHAR:
+        result.append((prev, MAX_CHAR))
+    return tuple(result)
+
+@functools.lru_cache(maxsize=None)
+def _categories():
+    """
+    Returns the intervals matched by each shorthand class, keyed by its RegEx such as `\\d`.
+
+    The `re` engine itself scans every codepoint once per class,
+    so the intervals agree exactly with how `re` matches the shorthands.
+    The codepoints are decoded from a single buffer, which is much faster than joining them one by one.
+    """
+    typecode = 'I' if array.array('I').itemsize == 4 else 'L'
+    codepoints = array.array(typecode, range(MAX_CHAR + 1)).tobytes()
+    universe = codepoints.decode(f'utf-32-{sys.byteorder[0]}e', 'surrogatepass')
+    return {
+        regex: tuple((m.start(), m.end() - 1) for m in re.finditer(regex + '+', universe))
+        for regex in (r'\d', r'\s', r'\w')
+    }
+
+@functools.lru_cache(maxsize=128)
+def _charset(items):
+    """
+    Converts the items of a parsed character set into intervals.
+
+    Repeated copies of a set share the cached intervals instead of merging them again.
+
+    Parameters:
+    - items (tuple): The (op, av) items of the parsed set.
+    """
+    intervals = []
+    negated = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negated = True
+        elif op is sre_constants.LITERAL:
+            intervals.append((av, av))
+        elif op is sre_constants.RANGE:
+            intervals.append(av)
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            regex, negate = _CATEGORIES[av]
+            category = _categories()[regex]
+            intervals.extend(_complement(category) if negate else category)
+        else:
+            raise EngineUnsupported(f'character set item {op}')
+    intervals = _union(intervals)
+    return _complement(intervals) if negated else intervals
+
+
+
+############################
+# Pattern Parsing
+########
+
+def parse(regex):
+    """
+    Parses a RegEx string into the `re` module's syntax tree.
+
+    Parameters:
+    - regex (str): The RegEx string of a pattern.
+
+    Returns:
+    - The parsed subpattern.
+
+    Raises:
+    - EngineUnsupported: If the RegEx is invalid or uses flags.
+    """
+    try:
+        parsed = sre_parse.parse(regex)
+    except re.error as error:
+        raise EngineUnsupported(f'invalid RegEx ({error})')
+
+    state = getattr(parsed, 'state', None) or parsed.pattern
+    if state.flags & ~sre_constants.SRE_FLAG_UNICODE:
+        raise EngineUnsupported('inline flags')
+
+    return parsed
+
+def _literal_prefix(items):
+    """
+    Collects the literal characters every match of the parsed items starts with.
+
+    Returns:
+    - tuple: (prefix, complete) where `complete` is True if the items are entirely literal.
+    """
+    prefix = ''
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            prefix += chr(av)
+        elif op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            part, complete = _literal_prefix(av[3])
+            prefix += part
+            if not complete:
+                return prefix, False
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue  # Zero-width, the match text still starts with the prefix
+        else:
+            return prefix, False
+    return prefix, True
+
+def _has_lookarounds(items):
+    for op, av in items:
+        if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return True
+        for value in av if isinstance(av, (tuple, list)) else ():
+            if isinstance(value, sre_parse.SubPattern):
+                if _has_lookarounds(value):
+                    return True
+            elif isinstance(value, list) and any(_has_lookarounds(branch) for branch in value if isinstance(branch, sre_parse.SubPattern)):
+                return True
+    return False
+
+@functools.lru_cache(maxsize=128)
+def max_width(regex):
+    """
+    Returns the most characters a match of a RegEx string can span.
+
+    Lookarounds read text outside of the match, so patterns using them count as unbounded.
+
+    Parameters:
+    - regex (str): The RegEx string of a pattern.
+
+    Returns:
+    - int: The maximum match length, or None if it is unbounded.
+    """
+    try:
+        parsed = parse(regex)
+    except EngineUnsupported:
+        return None
+
+    if _has_lookarounds(parsed):
+        return None
+
+    width = parsed.getwidth()[1]
+    return width if width < sre_constants.MAXREPEAT - 1 else None
+
+@functools.lru_cache(maxsize=128)
+def literal_prefix(regex):
+    """
+    Returns the literal text every match of a RegEx string starts with.
+
+    Parameters:
+    - regex (str): The RegEx string of a pattern.
+
+    Returns:
+    - str: The literal prefix, or an empty string if there is none.
+    """
+    try:
+        return _literal_prefix(parse(regex))[0]
+    except EngineUnsupported:
+        return ''
+
+
+
+############################
+# Thompson NFA
+########
+
+class NFA:
+    """
+    A Thompson NFA built from a parsed pattern.
+
+    Attributes:
+        - eps (list): Epsilon transitions of each state.
+        - edges (list): Character transitions of each state as (intervals, target) pairs.
+        - asserts (list): Conditional epsilon transitions of each state as (kind, target) or None.
+        - start (int): The entry state.
+        - accept (int): The accepting state.
+        - boundaries (bool): Indicates if the pattern asserts word boundaries.
+        - end_asserts (set): The states asserting the end of the text or of the line.
+    """
+    def __init__(self, parsed):
+        self.eps = []
+        self.edges = []
+        self.asserts = []
+        self.boundaries = False
+        self.end_asserts = set()
+        self.start, self.accept = self._build(parsed)
+
+    def _state(self):
+        if len(self.eps) >= MAX_NFA_STATES:
+            raise EngineUnsupported('too many NFA states')
+        self.eps.append([])
+        self.edges.append([])
+        self.asserts.append(None)
+        return len(self.eps) - 1
+
+    def _chars(self, intervals):
+        entry, exit = self._state(), self._state()
+        self.edges[entry].append((intervals, exit))
+        return entry, exit
+
+    def _build(self, items):
+        entry = exit = self._state()
+        for op, av in items:
+            node_entry, node_exit = self._build_node(op, av)
+            self.eps[exit].append(node_entry)
+            exit = node_exit
+        return entry, exit
+
+    def _build_node(self, op, av):
+        if op is sre_constants.LITERAL:
+            return self._chars(((av, av),))
+
+        if op is sre_constants.NOT_LITERAL:
+            return self._chars(_complement(((av, av),)))
+
+        if op is sre_constants.ANY:
+            return self._chars(_complement(((10, 10),)))
+
+        if op is sre_constants.IN:
+            return self._chars(_charset(tuple(av)))
+
+        if op is sre_constants.SUBPATTERN:
+            group, add_flags, del_flags, items = av
+            if add_flags or del_flags:
+                raise EngineUnsupported('scoped flags')
+            return self._build(items)
+
+        if op is sre_constants.BRANCH:
+            entry, exit = self._state(), self._state()
+            for items in av[1]:
+                branch_entry, branch_exit = self._build(items)
+                self.eps[entry].append(branch_entry)
+                self.eps[branch_exit].append(exit)
+            return entry, exit
+
+        if op is sre_constants.MAX_REPEAT:
+            min_rep, max_rep, items = av
+            entry = exit = self._state()
+
+            # Required copies
+            for _ in range(min_rep):
+                copy_entry, copy_exit = self._build(items)
+                self.eps[exit].append(copy_entry)
+                exit = copy_exit
+
+            # Unbounded copies loop back through a single copy
+            if max_rep == sre_constants.MAXREPEAT:
+                loop, end = self._state(), self._state()
+                copy_entry, copy_exit = self._build(items)
+                self.eps[exit].append(loop)
+                self.eps[loop] += [copy_entry, end]
+                self.eps[copy_exit].append(loop)
+                return entry, end
+
+            # Optional copies nest, so skipping one skips the rest and closures stay small
+            end = self._state()
+            for _ in range(max_rep - min_rep):
+                copy_entry, copy_exit = self._build(items)
+                self.eps[exit] += [copy_entry, end]
+                exit = copy_exit
+            self.eps[exit].append(end)
+            return entry, end
+
+        if op is sre_constants.AT and av in _ASSERTIONS:
+            entry, exit = self._state(), self._state()
+            self.asserts[entry] = (_ASSERTIONS[av], exit)
+            if _ASSERTIONS[av] in (_BOUNDARY, _NOT_BOUNDARY):
+                self.boundaries = True
+            elif _ASSERTIONS[av] in (_END, _EOL):
+                self.end_asserts.add(entry)
+            return entry, exit
+
+        raise EngineUnsupported(_UNSUPPORTED.get(av if op is sre_constants.AT else op, str(op).lower()))
+
+    def closure(self, states, begin=False, end=False, eol=False, boundary=None):
+        """
+        Returns the states reachable through epsilon transitions.
+
+        Assertions are only followed when their condition is enabled.
+        Boundary assertions are only followed when `boundary` is known (True or False).
+        """
+        seen = set(states)
+        stack = list(seen)
+        while stack:
+            state = stack.pop()
+            targets = self.eps[state]
+            condition = self.asserts[state]
+            if condition is not None:
+                kind, target = condition
+                if (
+                    kind is _BEGIN and begin
+                    or kind is _END and end
+                    or kind is _EOL and (end or eol)
+                    or kind is _BOUNDARY and boundary is True
+                    or kind is _NOT_BOUNDARY and boundary is False
+                ):
+                    targets = targets + [target]
+            for target in targets:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return frozenset(seen)
+
+    def final(self, states, begin=False):
+        """
+        Returns the final flags of a closed set of states.
+
+        With `begin`, the states are the start state at the beginning of the text,
+        where an end assertion can also hold if the text is empty or a single newline.
+        """
+        if self.accept in states:
+            flags = ACCEPTS | ACCEPTS_AT_END | ACCEPTS_BEFORE_NEWLINE
+            return flags | ACCEPTS_EMPTY_TEXT | ACCEPTS_NEWLINE_TEXT if begin else flags
+        # Only an end assertion can lead on to the accepting state
+        if self.end_asserts.isdisjoint(states):
+            return 0
+
+        flags = 0
+        if self.accept in self.closure(states, end=True):
+            flags |= ACCEPTS_AT_END
+        if self.accept in self.closure(states, eol=True):
+            flags |= ACCEPTS_BEFORE_NEWLINE
+        if begin and self.accept in self.closure(states, begin=True, end=True):
+            flags |= ACCEPTS_EMPTY_TEXT
+        if begin and self.accept in self.closure(states, begin=True, eol=True):
+            flags |= ACCEPTS_NEWLINE_TEXT
+        return flags
+
+    def check_end_assertions(self):
+        """
+        Ensures nothing is consumed after an end assertion.
+
+        An end assertion can be followed by a newline (`$\\n`),
+        which the automata do not model.
+        """
+        for condition in self.asserts:
+            if condition is not None and condition[0] in (_END, _EOL):
+                reachable = self.closure((condition[1],), begin=True, end=True)
+                if any(self.edges[state] for state in reachable):
+                    raise EngineUnsupported('characters after an end anchor')
+
+    def first_chars(self):
+        """
+        Returns the intervals of characters a match can start with.
+
+        Returns:
+        - tuple: The merged intervals, or None if the pattern can match an empty text.
+        """
+        states = self.closure((self.start,), begin=True, end=True, boundary=True)
+        states |= self.closure((self.start,), begin=True, end=True, boundary=False)
+        if self.accept in states:
+            return None
+        return _union(interval for state in states for intervals, _ in self.edges[state] for interval in intervals)
+
+    def alphabet(self):
+        """
+        Splits the codepoints into classes no transition can tell apart.
+
+        Returns:
+        - list: The first codepoint of each class, in ascending order.
+        """
+        bounds = {0}
+        charsets = {intervals for edges in self.edges for intervals, _ in edges}
+        for intervals in charsets:
+            for lo, hi in intervals:
+                bounds.add(lo)
+                if hi < MAX_CHAR:
+                    bounds.add(hi + 1)
+        return sorted(bounds)
+
+    def reversed(self):
+        """
+        Returns the NFA with every transition reversed, which reads a text from right to left.
+
+        The reversed NFA keeps the same states with the start and accepting states swapped.
+        Assertions still hold at the same positions of the text, so they keep their kinds.
+        """
+        reverse = NFA.__new__(NFA)
+        reverse.eps = [[] for _ in self.eps]
+        reverse.edges = [[] for _ in self.edges]
+        reverse.asserts = [None] * len(self.asserts)
+        reverse.end_asserts = set()
+        for state, targets in enumerate(self.eps):
+            for target in targets:
+                reverse.eps[target].append(state)
+        for state, edges in enumerate(self.edges):
+            for intervals, target in edges:
+                reverse.edges[target].append((intervals, state))
+        # Every assertion leads to its own new state, so each state has at most one to reverse
+        for state, condition in enumerate(self.asserts):
+            if condition is not None:
+                kind, target = condition
+                reverse.asserts[target] = (kind, state)
+                if kind in (_END, _EOL):
+                    reverse.end_asserts.add(target)
+        reverse.boundaries = self.boundaries
+        reverse.start, reverse.accept = self.accept, self.start
+        return reverse
+
+
+
+############################
+# DFA Construction
+########
+
+def _masks(nfa, bounds):
+    """
+    Converts each NFA edge into a bitmask of the alphabet classes it accepts.
+
+    Returns:
+    - list: The (mask, target) pairs of each state.
+    """
+    # Repeated copies of a character set share one mask
+    charset_masks = {}
+    masks = []
+    for edges in nfa.edges:
+        state_masks = []
+        for intervals, target in edges:
+            mask = charset_masks.get(intervals)
+            if mask is None:
+                mask = 0
+                for lo, hi in intervals:
+                    first = bisect.bisect_left(bounds, lo)
+                    last = bisect.bisect_left(bounds, hi + 1)
+                    mask |= ((1 << (last - first)) - 1) << first
+                charset_masks[intervals] = mask
+            state_masks.append((mask, target))
+        masks.append(state_masks)
+    return masks
+
+def _reversed_masks(masks):
+    """
+    Returns the masks of the reversed NFA, where every edge leads back to its source.
+    """
+    reverse = [[] for _ in masks]
+    for state, state_masks in enumerate(masks):
+        for mask, target in state_masks:
+            reverse[target].append((mask, state))
+    return reverse
+
+def _determinize(nfa, bounds, masks):
+    """
+    Runs the subset construction over the NFA.
+
+    A DFA needing more states than its NFA is growing exponentially,
+    so the construction gives up early instead of paying for states a scan would rarely visit.
+    Each DFA state costs a closure over its NFA states, so their total is bounded as well.
+
+    Returns:
+    - tuple: (table, final, start, start_at_beginning) with state 0 as the dead state.
+
+    Raises:
+    - EngineUnsupported: If the DFA outgrows its NFA, `MAX_DFA_CELLS` or `MAX_SUBSET_STATES`.
+    """
+    width = len(bounds)
+
+    sets = [frozenset()]
+    ids = {frozenset(): 0}
+    table = [0] * width
+    subset_states = 0
+
+    def state_id(states):
+        nonlocal subset_states
+        if states not in ids:
+            subset_states += len(states)
+            if (
+                len(sets) > len(nfa.eps)
+                or len(table) + width > MAX_DFA_CELLS
+                or subset_states > MAX_SUBSET_STATES
+            ):
+                raise EngineUnsupported('too many DFA states')
+            ids[states] = len(sets)
+            sets.append(states)
+            table.extend([0] * width)
+        return ids[states]
+
+    start = state_id(nfa.closure((nfa.start,)))
+    start_at_beginning = state_id(nfa.closure((nfa.start,), begin=True))
+
+    closures = {}
+    index = 1
+    while index < len(sets):
+        # Copies of a repeated set share one mask, so gather the targets of each mask first
+        targets_by_mask = {}
+        for state in sets[index]:
+            for mask, target in masks[state]:
+                targets_by_mask.setdefault(mask, set()).add(target)
+
+        # Split the alphabet classes into atoms whose classes all move to the same NFA targets
+        atoms = []
+        for mask, mask_targets in targets_by_mask.items():
+            refined = []
+            for atom, targets in atoms:
+                inside = atom & mask
+                if inside:
+                    refined.append((inside, targets | mask_targets))
+                    if inside != atom:
+                        refined.append((atom ^ inside, targets))
+                    mask ^= inside
+                else:
+                    refined.append((atom, targets))
+            if mask:
+                refined.append((mask, frozenset(mask_targets)))
+            atoms = refined
+
+        row = index * width
+        for atom, targets in atoms:
+            if targets not in closures:
+                closures[targets] = state_id(nfa.closure(targets))
+            following = closures[targets]
+            while atom:
+                low = atom & -atom
+                table[row + low.bit_length() - 1] = following
+                atom ^= low
+        index += 1
+
+    final = [nfa.final(states) for states in sets]
+    final[start_at_beginning] = nfa.final(sets[start_at_beginning], begin=True)
+    return table, final, start, start_at_beginning
+
+def _minimize(table, final, width, starts):
+    """
+    Merges equivalent DFA states with Hopcroft's partition refinement.
+
+    Returns:
+    - tuple: (table, final, starts) of the minimized DFA with state 0 as the dead state.
+    """
+    count = len(final)
+
+    # Incoming transitions of each state as (class, source) pairs
+    incoming = [[] for _ in range(count)]
+    for state in range(count):
+        row = state * width
+        for cls in range(width):
+            incoming[table[row + cls]].append((cls, state))
+
+    # Start from the partition by final flags
+    groups = {}
+    for state, flags in enumerate(final):
+        groups.setdefault(flags, set()).add(state)
+    blocks = list(groups.values())
+    block_of = [0] * count
+    for index, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = index
+
+    pending = set(range(len(blocks)))
+    while pending:
+        # Only the classes with a transition into the splitter can split a block
+        sources_by_class = {}
+        for state in blocks[pending.pop()]:
+            for cls, source in incoming[state]:
+                sources_by_class.setdefault(cls, []).append(source)
+
+        for sources in sources_by_class.values():
+            touched = {}
+            for state in sources:
+                touched.setdefault(block_of[state], set()).add(state)
+
+            for index, inside in touched.items():
+                block = blocks[index]
+                if len(inside) == len(block):
+                    continue
+                outside = block - inside
+                blocks[index] = inside
+                blocks.append(outside)
+                new_index = len(blocks) - 1
+                for state in outside:
+                    block_of[state] = new_index
+                if index in pending or len(outside) <= len(inside):
+                    pending.add(new_index)
+                else:
+                    pending.add(index)
+
+    # Renumber the blocks so the dead state stays 0
+    order = [block_of[0]] + [index for index in range(len(blocks)) if index != block_of[0]]
+    renumber = {index: new for new, index in enumerate(order)}
+
+    new_table = [0] * (len(blocks) * width)
+    new_final = [0] * len(blocks)
+    for index, block in enumerate(blocks):
+        state = next(iter(block))
+        new = renumber[index]
+        new_final[new] = final[state]
+        row, new_row = state * width, new * width
+        for cls in range(width):
+            new_table[new_row + cls] = renumber[block_of[table[row + cls]]]
+
+    return new_table, new_final, [renumber[block_of[state]] for state in starts]
+
+
+
+############################
+# Matchers
+########
+
+class Matcher(abc.ABC):
+    """
+    The searching shared by every automaton.
+
+    A search reads the text forward to find where the leftmost-longest match ends,
+    then reads that match backward with the reversed NFA to find where it starts.
+    A text without a match is read once, and each search reads its match a second time.
+    A search can read past its match to rule out a longer one, so `finditer` may read
+    some characters again, like a run of a's searched with `a*b|a`.
+
+    Attributes:
+        - prefix (str): The literal text every match starts with, or an empty string.
+        - scanner (re.Pattern): Finds the next character a match can start with, or None.
+
+    Methods:
+        - match(text, pos=0): Returns the end of the longest match starting at `pos`, or -1.
+        - search(text, pos=0): Returns the (start, end) span of the leftmost-longest match, or None.
+        - finditer(text, pos=0): Yields the (start, end) span of every match.
+    """
+    def __init__(self, nfa, bounds, scanner=None, prefix='', cache_bytes=CACHE_BYTES, masks=None):
+        # The first codepoint of each alphabet class.
+        self.bounds = bounds
+        self.scanner = scanner
+        self.prefix = prefix
+        self.cache_bytes = cache_bytes
+        # Alphabet class of each character seen so far.
+        self._classes = {}
+        self._used_bytes = 0
+        # The (mask, target) pairs of each NFA state, computed once per pattern by `_compile`.
+        self._masks = masks if masks is not None else _masks(nfa, bounds)
+        self._reverse = nfa.reversed()
+        self._reverse_masks = _reversed_masks(self._masks)
+        # Backward transitions between closed sets of reversed NFA states.
+        self._reverse_moves = {}
+        # The reversed start closed away from the ends of the text.
+        self._reverse_start = self._reverse.closure((self._reverse.start,))
+
+    def _charge(self, size):
+        """
+        Counts memory about to be cached, flushing every cache first if it would exceed `cache_bytes`.
+        """
+        self._used_bytes += size
+        if self._used_bytes > self.cache_bytes:
+            self._flush()
+            self._used_bytes = size
+
+    def _flush(self):
+        self._classes.clear()
+        self._reverse_moves.clear()
+
+    def _classify(self, char):
+        cls = bisect.bisect_right(self.bounds, ord(char)) - 1
+        self._charge(_CLASS_BYTES)
+        self._classes[char] = cls
+        return cls
+
+    @abc.abstractmethod
+    def match(self, text, pos=0):
+        """
+        Returns the end of the longest match starting at `pos`, or -1 if there is none.
+        """
+
+    @abc.abstractmethod
+    def _search_pass(self, text, pos):
+        """
+        Runs one forward pass, following at most `MAX_SEARCH_LAYERS` candidate matches at once.
+
+        Returns:
+        - tuple: (end, resume) where `end` is the end of the leftmost-longest match or -1,
+          and `resume` is where the next pass starts if the pass stopped new candidates, or -1.
+        """
+
+    def _search_end(self, text, pos):
+        """
+        Returns the end of the leftmost-longest match starting at or after `pos`, or -1 if there is none.
+        """
+        length = len(text)
+        while True:
+            end, resume = self._search_pass(text, pos)
+            if end >= 0 or not pos < resume <= length:
+                return end
+            pos = resume
+
+    def search(self, text, pos=0):
+        """
+        Returns the (start, end) span of the leftmost-longest match starting at or after `pos`,
+        or None if there is none.
+        """
+        end = self._search_end(text, pos)
+        if end < 0:
+            return None
+        return self._match_start(text, pos, end), end
+
+    def finditer(self, text, pos=0):
+        """
+        Yields the (start, end) span of every non-overlapping match, scanning left to right from `pos`.
+
+        Empty matches follow the same rules as `re.finditer`.
+        """
+        length = len(text)
+        while pos <= length:
+            span = self.search(text, pos)
+            if span is None:
+                return
+            yield span
+            start, end = span
+            pos = end if end > start else end + 1
+
+    def _match_start(self, text, pos, end):
+        """
+        Returns the earliest start at or after `pos` of a match ending at `end`.
+        """
+        reverse, masks, moves = self._reverse, self._reverse_masks, self._reverse_moves
+        classes, classify = self._classes, self._classify
+        length = len(text)
+        # Away from the ends of the text, only word boundaries depend on the position
+        cached = not reverse.boundaries
+        if cached and 0 < end < length - 1:
+            states = self._reverse_start
+        else:
+            states = _closure(reverse, (reverse.start,), text, end)
+        start = index = end
+
+        while True:
+            if reverse.accept in states:
+                start = index
+            if index == pos:
+                return start
+
+            char = text[index - 1]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            index -= 1
+            if cached and 0 < index < length - 1:
+                following = moves.get((states, cls))
+                if following is None:
+                    following = reverse.closure(_targets(masks, states, cls))
+                    self._charge(_TRANSITION_BYTES)
+                    moves[states, cls] = following
+            else:
+                following = _closure(reverse, _targets(masks, states, cls), text, index)
+            if not following:
+                return start
+            states = following
+
+class _SearchState:
+    """
+    A state of the forward search, cached with its transitions.
+
+    Attributes:
+        - layers (tuple): The automaton state of each candidate match, earliest start first.
+        - searching (bool): Indicates if a match can still start at the following positions.
+        - accepts (bool): Indicates if a candidate match accepts wherever it stands.
+        - moves (dict): The following search state for each alphabet class.
+    """
+    __slots__ = ('layers', 'searching', 'accepts', 'moves')
+
+    def __init__(self, layers, searching, accepts):
+        self.layers = layers
+        self.searching = searching
+        self.accepts = accepts
+        self.moves = {}
+
+class _CachedSearch(Matcher):
+    """
+    Finds where the leftmost-longest match ends in a forward pass over DFA states.
+
+    The search follows the candidate matches at once, earliest start first.
+    A candidate in the same DFA state as an earlier one is dropped, since the earlier one wins,
+    so a search state holds at most one candidate per DFA state.
+    Once a candidate accepts, later candidates are dropped and no new ones start.
+    Patterns like `\\d{100}` keep one candidate per count, so new candidates also stop at
+    `MAX_SEARCH_LAYERS` and another pass picks up after them if none of them matches.
+    Search states and their transitions are cached like the states of a DFA.
+    """
+    def __init__(self, nfa, bounds, scanner=None, prefix='', cache_bytes=CACHE_BYTES, masks=None):
+        super().__init__(nfa, bounds, scanner, prefix, cache_bytes, masks)
+        # Each cached search state, keyed by its layers and whether it is searching.
+        self._search_states = {}
+        # Search states kept across flushes, so the search loop can compare them by identity.
+        self._pinned = ()
+        self._dead = self._intern((), False)
+        self._idle = self._intern((self.start,), True)
+        self._pinned = (self._dead, self._idle)
+
+    @abc.abstractmethod
+    def _next(self, state, cls):
+        """
+        Returns the DFA state following `state` on alphabet class `cls`.
+        """
+
+    @abc.abstractmethod
+    def _flags(self, state):
+        """
+        Returns the final flags of a DFA state.
+        """
+
+    @abc.abstractmethod
+    def _initial(self, pos):
+        """
+        Returns the DFA state a match starting at `pos` begins in.
+        """
+
+    def _flush(self):
+        super()._flush()
+        for state in self._search_states.values():
+            state.moves.clear()
+        self._search_states.clear()
+        for state in self._pinned:
+            self._search_states[state.layers, state.searching] = state
+
+    def _intern(self, layers, searching):
+        kept = []
+        accepts = False
+        for state in layers:
+            if state and state not in kept:
+                kept.append(state)
+                if self._flags(state) & ACCEPTS:
+                    accepts = True
+                    searching = False
+                    break
+        if len(kept) >= MAX_SEARCH_LAYERS:
+            searching = False
+        # A dead start state can only match at the beginning of the text
+        key = tuple(kept), searching and bool(self.start)
+
+        state = self._search_states.get(key)
+        if state is None:
+            state = self._search_states[key] = _SearchState(*key, accepts)
+            self._charge(_TRANSITION_BYTES + sys.getsizeof(key[0]))
+        return state
+
+    def _move(self, state, cls):
+        layers = [self._next(layer, cls) for layer in state.layers]
+        if state.searching:
+            layers.append(self.start)
+        following = self._intern(layers, state.searching)
+        # Stopping new candidates is left uncached, so the search loop sees where it happened
+        if following.searching == state.searching or following.accepts:
+            self._charge(_TRANSITION_BYTES)
+            state.moves[cls] = following
+        return following
+
+    def _search_pass(self, text, pos):
+        classes, classify = self._classes, self._classify
+        prefix = self.prefix
+        search = self.scanner.search if self.scanner is not None else None
+        dead, idle = self._dead, self._idle
+        if idle.accepts or not prefix and search is None:
+            idle = None
+        state = self._idle if pos else self._intern((self._initial(pos),), True)
+        # The last character and the end of the text can satisfy `$`, so they are left to `_search_tail`
+        stop = len(text) - 1
+        last = resume = -1
+
+        while pos < stop:
+            if state is idle:
+                # Skip every position that cannot start a match in one C-level scan
+                if prefix:
+                    pos = text.find(prefix, pos)
+                    if pos < 0:
+                        return -1, -1
+                else:
+                    found = search(text, pos)
+                    if found is None:
+                        return -1, -1
+                    pos = found.start()
+                if pos >= stop:
+                    break
+            if state.accepts:
+                last = pos
+
+            char = text[pos]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            following = state.moves.get(cls)
+            if following is None:
+                following = self._move(state, cls)
+                if following.searching != state.searching and not following.accepts:
+                    resume = pos + 2
+            state = following
+            if state is dead:
+                return last, resume
+            pos += 1
+
+        return self._search_tail(text, pos, state, last, resume)
+
+    def _search_tail(self, text, pos, state, last, resume):
+        layers, searching = list(state.layers), state.searching
+        length = len(text)
+
+        while True:
+            for index, layer in enumerate(layers):
+                flags = self._flags(layer)
+                if flags and (
+                    flags & ACCEPTS
+                    or flags & ACCEPTS_AT_END and pos == length
+                    or flags & ACCEPTS_BEFORE_NEWLINE and pos == length - 1 and text[pos] == '\n'
+                    or flags & ACCEPTS_EMPTY_TEXT and length == 0
+                    or flags & ACCEPTS_NEWLINE_TEXT and pos == 0 and text == '\n'
+                ):
+                    last = pos
+                    del layers[index + 1:]
+                    searching = False
+                    break
+            if pos == length or not layers and not searching:
+                return last, resume
+
+            char = text[pos]
+            cls = self._classes.get(char)
+            if cls is None:
+                cls = self._classify(char)
+            following = []
+            for layer in layers:
+                layer = self._next(layer, cls)
+                if layer and layer not in following:
+                    following.append(layer)
+            if searching and self.start and self.start not in following:
+                following.append(self.start)
+            if searching and len(following) >= MAX_SEARCH_LAYERS:
+                searching = False
+                resume = pos + 2
+            layers = following
+            pos += 1
+
+class DFA(_CachedSearch):
+    """
+    A minimized DFA that finds leftmost-longest matches.
+
+    Attributes:
+        - bounds (list): The first codepoint of each alphabet class.
+        - table (list): The flat transition table, indexed by `state * len(bounds) + class`.
+        - final (list): The final flags of each state.
+        - start (int): The start state.
+        - start_at_beginning (int): The start state at the beginning of the text.
+    """
+    def __init__(self, nfa, bounds, table, final, start, start_at_beginning, scanner=None, prefix='', masks=None):
+        self.table = table
+        self.final = final
+        self.start = start
+        self.start_at_beginning = start_at_beginning
+        super().__init__(nfa, bounds, scanner, prefix, masks=masks)
+
+    def _next(self, state, cls):
+        return self.table[state * len(self.bounds) + cls]
+
+    def _flags(self, state):
+        return self.final[state]
+
+    def _initial(self, pos):
+        return self.start_at_beginning if pos == 0 else self.start
+
+    def match(self, text, pos=0):
+        """
+        Returns the end of the longest match starting at `pos`, or -1 if there is none.
+        """
+        table, final, width = self.table, self.final, len(self.bounds)
+        classes, classify = self._classes, self._classify
+        state = self.start_at_beginning if pos == 0 else self.start
+        length = len(text)
+        last = -1
+
+        while True:
+            flags = final[state]
+            if flags and (
+                flags & ACCEPTS
+                or flags & ACCEPTS_AT_END and pos == length
+                or flags & ACCEPTS_BEFORE_NEWLINE and pos == length - 1 and text[pos] == '\n'
+                or flags & ACCEPTS_EMPTY_TEXT and length == 0
+                or flags & ACCEPTS_NEWLINE_TEXT and pos == 0 and text == '\n'
+            ):
+                last = pos
+            if pos == length:
+                return last
+
+            char = text[pos]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            state = table[state * width + cls]
+            if not state:
+                return last
+            pos += 1
+
+class LazyDFA(_CachedSearch):
+    """
+    A DFA whose states are built on demand while scanning.
+
+    Patterns with large repetition counts can have more DFA states than fit in memory,
+    but a scan only visits a few of them. Visited states and transitions are cached,
+    and the cache is flushed whenever it grows past `cache_bytes`.
+
+    Attributes:
+        - nfa (NFA): The automaton the states are built from.
+        - state_cache (dict): Each cached state, keyed by its set of NFA states.
+    """
+    def __init__(self, nfa, bounds, scanner=None, prefix='', cache_bytes=CACHE_BYTES, masks=None):
+        self.nfa = nfa
+        self.state_cache = {}
+        self._transitions = {}
+        self._final = {}
+        self.start = nfa.closure((nfa.start,))
+        self.start_at_beginning = nfa.closure((nfa.start,), begin=True)
+        super().__init__(nfa, bounds, scanner, prefix, cache_bytes, masks)
+
+    def _flush(self):
+        self.state_cache.clear()
+        self._transitions.clear()
+        self._final.clear()
+        super()._flush()
+
+    def _next(self, state, cls):
+        following = self._transitions.get((state, cls))
+        if following is None:
+            following = self._step(state, cls)
+        return following
+
+    def _flags(self, state):
+        flags = self._final.get(state)
+        if flags is None:
+            flags = self._final[state] = self.nfa.final(state, begin=state == self.start_at_beginning)
+        return flags
+
+    def _initial(self, pos):
+        return self.start_at_beginning if pos == 0 else self.start
+
+    def _step(self, state, cls):
+        following = self.nfa.closure(_targets(self._masks, state, cls))
+
+        if following not in self.state_cache:
+            self._charge(sys.getsizeof(following))
+            self.state_cache[following] = following
+        following = self.state_cache[following]
+
+        self._charge(_TRANSITION_BYTES)
+        self._transitions[state, cls] = following
+        return following
+
+    def match(self, text, pos=0):
+        """
+        Returns the end of the longest match starting at `pos`, or -1 if there is none.
+        """
+        transitions, final = self._transitions, self._final
+        classes, classify = self._classes, self._classify
+        state = self.start_at_beginning if pos == 0 else self.start
+        length = len(text)
+        last = -1
+
+        while True:
+            flags = final.get(state)
+            if flags is None:
+                flags = self._flags(state)
+            if flags and (
+                flags & ACCEPTS
+                or flags & ACCEPTS_AT_END and pos == length
+                or flags & ACCEPTS_BEFORE_NEWLINE and pos == length - 1 and text[pos] == '\n'
+                or flags & ACCEPTS_EMPTY_TEXT and length == 0
+                or flags & ACCEPTS_NEWLINE_TEXT and pos == 0 and text == '\n'
+            ):
+                last = pos
+            if pos == length:
+                return last
+
+            char = text[pos]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            following = transitions.get((state, cls))
+            if following is None:
+                following = self._step(state, cls)
+            state = following
+            if not state:
+                return last
+            pos += 1
+
+class NFASimulator(Matcher):
+    """
+    Runs the NFA directly by tracking every active state at once.
+
+    Word boundaries depend on the characters around each position, which a DFA state
+    cannot remember, so patterns with `simply.bound()` are simulated instead.
+    The forward search tracks the states of the candidate matches, earliest start first,
+    and keeps each NFA state only in the earliest candidate that reaches it.
+
+    Attributes:
+        - nfa (NFA): The simulated automaton.
+    """
+    def __init__(self, nfa, bounds, scanner=None, prefix='', masks=None):
+        super().__init__(nfa, bounds, scanner, prefix, masks=masks)
+        self.nfa = nfa
+
+    def match(self, text, pos=0):
+        """
+        Returns the end of the longest match starting at `pos`, or -1 if there is none.
+        """
+        nfa, masks = self.nfa, self._masks
+        classes, classify = self._classes, self._classify
+        states = _closure(nfa, (nfa.start,), text, pos)
+        length = len(text)
+        last = -1
+
+        while True:
+            if nfa.accept in states:
+                last = pos
+            if pos == length:
+                return last
+
+            char = text[pos]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            targets = _targets(masks, states, cls)
+            if not targets:
+                return last
+            pos += 1
+            states = _closure(nfa, targets, text, pos)
+
+    def _search_pass(self, text, pos):
+        nfa, masks = self.nfa, self._masks
+        classes, classify = self._classes, self._classify
+        prefix = self.prefix
+        search = self.scanner.search if self.scanner is not None else None
+        length = len(text)
+        layers = []
+        searching = True
+        last = resume = -1
+
+        while True:
+            if searching:
+                if not layers:
+                    # Skip every position that cannot start a match in one C-level scan
+                    if prefix:
+                        pos = text.find(prefix, pos)
+                        if pos < 0:
+                            return -1, -1
+                    elif search is not None:
+                        found = search(text, pos)
+                        if found is None:
+                            return -1, -1
+                        pos = found.start()
+                layers.append((nfa.start,))
+
+            seen = set()
+            closed = []
+            for layer in layers:
+                states = _closure(nfa, layer, text, pos) - seen
+                if states:
+                    seen |= states
+                    closed.append(states)
+                    if nfa.accept in states:
+                        last = pos
+                        searching = False
+                        break
+            layers = closed
+            if searching and len(layers) >= MAX_SEARCH_LAYERS:
+                searching = False
+                resume = pos + 1
+            if pos == length or not layers and not searching:
+                return last, resume
+
+            char = text[pos]
+            cls = classes.get(char)
+            if cls is None:
+                cls = classify(char)
+            layers = [_targets(masks, states, cls) for states in layers]
+            pos += 1
+
+def _targets(masks, states, cls):
+    """
+    Returns the NFA states reached from `states` by a character of alphabet class `cls`.
+    """
+    targets = set()
+    for state in states:
+        for mask, target in masks[state]:
+            if mask >> cls & 1:
+                targets.add(target)
+    return targets
+
+def _closure(nfa, states, text, pos):
+    """
+    Returns the epsilon closure of `states` with the assertions that hold at `pos` in the text.
+    """
+    length = len(text)
+    boundary = None
+    if nfa.boundaries and text:
+        before = pos > 0 and _is_word(text[pos - 1])
+        after = pos < length and _is_word(text[pos])
+        boundary = before != after
+    return nfa.closure(
+        states,
+        begin=pos == 0,
+        end=pos == length,
+        eol=pos == length - 1 and text[pos] == '\n',
+        boundary=boundary,
+    )
+
+def _is_word(char):
+    return char.isalnum() or char == '_'
+
+
+############################
+# Compilation
+########
+
+def _scanner(intervals):
+    """
+    Compiles a character set that finds the next possible start of a match.
+
+    The `re` engine tests the set against each character in C,
+    which is much faster than stepping the automaton from every position.
+    """
+    if intervals is None:
+        return None
+    if not intervals:
+        return re.compile('(?!)')
+    joined = ''.join(f'\\U{lo:08x}-\\U{hi:08x}' for lo, hi in intervals)
+    return re.compile(f'[{joined}]')
+
+@functools.lru_cache(maxsize=CACHED_MATCHERS)
+def _compile(regex):
+    try:
+        parsed = parse(regex)
+        nfa = NFA(parsed)
+        nfa.check_end_assertions()
+    except EngineUnsupported as error:
+        return None, error.reason
+
+    bounds = nfa.alphabet()
+    scanner = _scanner(nfa.first_chars())
+    prefix = _literal_prefix(parsed)[0]
+    masks = _masks(nfa, bounds)
+    if nfa.boundaries:
+        return NFASimulator(nfa, bounds, scanner, prefix, masks), None
+
+    try:
+        table, final, start, start_at_beginning = _determinize(nfa, bounds, masks)
+    except EngineUnsupported:
+        return LazyDFA(nfa, bounds, scanner, prefix, masks=masks), None
+
+    table, final, starts = _minimize(table, final, len(bounds), (start, start_at_beginning))
+    return DFA(nfa, bounds, table, final, *starts, scanner, prefix, masks), None
+
+def compile_dfa(regex):
+    """
+    Compiles a RegEx string into a minimized DFA.
+
+    The last `CACHED_MATCHERS` automata are cached by RegEx string, like `re.compile`.
+
+    Parameters:
+    - regex (str): The RegEx string of a pattern.
+
+    Returns:
+    - Matcher: The minimized DFA, a LazyDFA if the DFA outgrows its NFA, `MAX_DFA_CELLS` or `MAX_SUBSET_STATES`,
+      or an NFASimulator if the pattern asserts word boundaries.
+
+    Raises:
+    - EngineUnsupported: If the pattern uses backreferences, lookarounds,
+      lazy or possessive repetition, flags, or grows beyond `MAX_NFA_STATES`.
+    """
+    dfa, reason = _compile(regex)
+    if dfa is None:
+        raise EngineUnsupported(reason)
+    return dfa
@@ -1,5 +1,6 @@
 
-import re, textwrap
+import functools, re
+from .engine import EngineUnsupported, compile_dfa, literal_prefix, max_width
 
 
 
@@ -7,16 +8,33 @@ import re, textwrap
 # Base Functions
 ########
 
+@functools.lru_cache(maxsize=64)
+def _normalize(message):
+    """
+    Dedents and strips an error message, indenting each line after the first with a tab.
+
+    The common indentation is found in one pass over the lines and removed with slicing,
+    then a single join builds the result instead of chaining dedent, strip, and replace.
+    Messages are mostly constant templates, so each is normalized once and then reused.
+    """
+    lines = message.split('\n')
+    margin = min((len(line) - len(line.lstrip()) for line in lines if line.strip()), default=0)
+    return '\n\t'.join(line[margin:] if line.strip() else '' for line in lines).strip()
+
 class STRlingError(ValueError):
     def __init__(self, message):
-        self.message = textwrap.dedent(message).strip().replace('\n', '\n\t')
+        self.message = _normalize(message)
         super().__init__(self.message)
 
     def __str__(self):
         return f"\n\nSTRlingError: Invalid Pattern Attempted.\n\n\t{self.message}"
 
+# Every character `re.escape` changes, plus '/', mapped to its escape.
+_escapes = {ord(char): re.escape(char) for char in map(chr, range(128)) if re.escape(char) != char}
+_escapes[ord('/')] = '\\/'
+
 def lit(text):
-    escaped_text = re.escape(text).replace('/', '\/')
+    escaped_text = text.translate(_escapes)
     return Pattern(escaped_text)
 
 def repeat(min_rep: int = None, max_rep: int = None):
@@ -46,14 +64,26 @@ class Pattern:
         - pattern (str): The regex pattern as a string.
         - custom_set (bool): Indicates if the pattern is a custom character set.
         - composite (bool): Indicates if the pattern is a composite pattern.
-        - repeatable (bool): Indicates if the pattern can be repeated.
+        - named_groups (tuple): The names of the named groups within the pattern.
+        - numbered_group (bool): Indicates if the pattern is a numbered group.
 
     Methods:
         - __call__(min_rep=None, max_rep=None): Returns a new Pattern object with the repetition pattern applied.
         - __str__(): Returns the pattern as a string.
         - __add__(other): Allows addition of two Pattern objects.
+        - literal_prefix(): Returns the literal text every match starts with.
+        - to_dfa(): Returns the pattern compiled into a minimized DFA.
+        - compiled(): Returns the pattern compiled by `re`.
+        - finditer(text): Returns an iterator over the match objects in the text.
+        - first_match(text): Returns the first match object in the text, or None.
+        - findall(text, engine='re'): Returns every match of the pattern in the text.
+        - findall_iter(text, engine='re'): Yields every match of the pattern in the text.
+        - stream(chunks, engine='re'): Yields every match of the pattern across chunks of text.
     """
-    def __init__(self, pattern: str, custom_set: bool = False, negated: bool = False, composite: bool = False, named_groups: list = [], numbered_group: bool = False):
+    # Patterns are built in large numbers by every simply function, so skip the per-instance __dict__.
+    __slots__ = ('pattern', 'custom_set', 'negated', 'composite', 'named_groups', 'numbered_group', '_compiled')
+
+    def __init__(self, pattern: str, custom_set: bool = False, negated: bool = False, composite: bool = False, named_groups: tuple = (), numbered_group: bool = False):
         # The regex pattern string for this instance.
         self.pattern = pattern
         # A custom set is regex with brackets [a-z]
@@ -66,6 +96,8 @@ class Pattern:
         self.named_groups = named_groups
         # A numbered_group is one that is copied rather than repeated
         self.numbered_group = numbered_group
+        # The `re` compiled pattern, created on first use.
+        self._compiled = None
 
     def __call__(self, min_rep: int = None, max_rep: int = None):
         """
@@ -171,3 +203,218 @@ class Pattern:
         Returns a copy of the pattern instance.
         """
         return cls(new_pattern, **kwargs)
+
+    def literal_prefix(self):
+        """
+        Returns the literal text every match of the pattern starts with.
+
+        Example: simply as s
+            - The prefix below is 'ERROR'.
+
+            s.merge('ERROR', s.letter(), s.digit()).literal_prefix()
+
+        The DFA engine uses the prefix to jump straight to each candidate match with `str.find`.
+
+        Returns:
+        - str: The literal prefix, or an empty string if the pattern starts with a set or range.
+        """
+        return literal_prefix(self.pattern)
+
+    def to_dfa(self):
+        """
+        Compiles the pattern into a minimized DFA.
+
+        The DFA never backtracks, so nested repetitions cannot make it retry exponentially many paths.
+        A search reads a text without matches once and reads each match a second time to find its start.
+        Patterns with too many DFA states build their states lazily within a bounded cache,
+        and patterns with boundaries run on an NFA simulation.
+
+        Note: The DFA returns the leftmost-longest match (POSIX semantics),
+        while `re` returns the leftmost match of the first alternative that succeeds.
+        The two only differ when an earlier alternative matches a shorter text.
+
+        Returns:
+        - DFA: The compiled automaton, cached by pattern.
+        """
+        try:
+            return compile_dfa(self.pattern)
+        except EngineUnsupported as error:
+            message = f"""
+            Method: Pattern.to_dfa()
+
+            The pattern cannot be compiled into a DFA: {error.reason}.
+
+            Backreferences, lookarounds and flags require the `re` engine.
+            Use `pattern.findall(text)` which picks the `re` engine for these patterns.
+            """
+            raise STRlingError(message)
+
+    def compiled(self):
+        """
+        Returns the pattern compiled by `re`, compiling it only on the first call.
+        """
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+        return self._compiled
+
+    def finditer(self, text):
+        """
+        Returns an iterator over the match objects of the pattern in the text.
+
+        Prefer this over `findall` when only some matches are needed or the text is large,
+        since matches are found one at a time instead of all being collected into a list.
+
+        Example: simply as s
+            for match in s.digit(3).finditer("123 and 456"):
+                print(match.group(), match.start())
+
+        Parameters:
+        - text (str): The text to search.
+
+        Returns:
+        - An iterator of `re.Match` objects, from left to right.
+        """
+        return self.compiled().finditer(text)
+
+    def first_match(self, text):
+        """
+        Returns the first match object of the pattern in the text, stopping the search there.
+
+        Parameters:
+        - text (str): The text to search.
+
+        Returns:
+        - The first `re.Match` object, or None if the pattern is absent.
+        """
+        return self.compiled().search(text)
+
+    def _dfa_for(self, engine, method):
+        """
+        Returns the DFA to match with, or None if the `re` engine should be used.
+        """
+        if engine == 'dfa':
+            try:
+                return compile_dfa(self.pattern)
+            except EngineUnsupported:
+                return None
+
+        if engine != 're':
+            message = f"""
+            Method: Pattern.{method}(text, engine)
+
+            The `engine` argument must be either 're' or 'dfa'.
+            """
+            raise STRlingError(message)
+
+        return None
+
+    def findall(self, text, engine='re'):
+        """
+        Returns every non-overlapping match of the pattern in the text.
+
+        Parameters:
+        - text (str): The text to search.
+        - engine (str): 're' for Python's backtracking engine or 'dfa' for the DFA that never backtracks.
+          Patterns the DFA cannot represent are matched with 're'.
+          The DFA runs in pure Python and is 5-11x slower than 're' on ordinary text,
+          and the first use of \\d, \\s or \\w costs about 0.25s to build their character ranges.
+          It only helps with nested repetitions that make 're' backtrack, so it is not a speedup.
+
+        Returns:
+        - list: The full text of every match, from left to right.
+        """
+        dfa = self._dfa_for(engine, 'findall')
+        if dfa is not None:
+            return [text[start:end] for start, end in dfa.finditer(text)]
+        return [match.group() for match in self.compiled().finditer(text)]
+
+    def findall_iter(self, text, engine='re'):
+        """
+        Yields every non-overlapping match of the pattern in the text, one at a time.
+
+        Unlike `findall`, no list is built, so memory stays constant
+        and the search stops as soon as the loop breaks.
+
+        Parameters:
+        - text (str): The text to search.
+        - engine (str): 're' for Python's backtracking engine or 'dfa' for the DFA that never backtracks.
+
+        Returns:
+        - An iterator of the full text of every match, from left to right.
+        """
+        dfa = self._dfa_for(engine, 'findall_iter')
+        if dfa is not None:
+            return (text[start:end] for start, end in dfa.finditer(text))
+        return (match.group() for match in self.compiled().finditer(text))
+
+    def stream(self, chunks, engine='re'):
+        """
+        Yields every match of the pattern across an iterable of text chunks, such as the lines of a file.
+
+        The pattern is compiled once and reused for every chunk.
+        When the pattern has a maximum length, the end of each chunk is carried into the next one,
+        so matches spanning two chunks are found as if the chunks were one text.
+        Patterns without a maximum length, like `s.digit(1, 0)`, or with lookarounds are matched within each chunk,
+        so their lookarounds cannot see the neighbouring chunks and `s.start()` matches at the start of every chunk.
+
+        Example: simply as s
+            with open('app.log') as log:
+                for error_code in s.merge('E', s.digit(4)).stream(log):
+                    print(error_code)
+
+        Parameters:
+        - chunks (iterable of str): The text to search, in order.
+        - engine (str): 're' for Python's backtracking engine or 'dfa' for the DFA that never backtracks.
+
+        Returns:
+        - An iterator of the full text of every match, from left to right.
+        """
+        dfa = self._dfa_for(engine, 'stream')
+        if dfa is not None:
+            spans = dfa.finditer
+        else:
+            finditer = self.compiled().finditer
+
+            def spans(text, pos):
+                return (match.span() for match in finditer(text, pos))
+
+        width = max_width(self.pattern)
+        if width is None:
+            return (chunk[start:end] for chunk in chunks for start, end in spans(chunk, 0))
+        return self._stream_carried(chunks, spans, width)
+
+    @staticmethod
+    def _stream_carried(chunks, spans, width):
+        """
+        Yields the matches across chunks, carrying the last `width` characters into the next chunk.
+        """
+        buffer = ''
+        # Where the next scan starts in the buffer.
+        pos = 0
+        # Where an empty match was already yielded, so it is not yielded twice.
+        empty_at = -1
+
+        for chunk in chunks:
+            buffer += chunk
+            # Matches starting before `safe` end before the last character, so more text cannot change them.
+            safe = len(buffer) - width - 1
+            for start, end in spans(buffer, pos):
+                if start >= safe:
+                    break
+                if start == end == empty_at:
+                    continue
+                yield buffer[start:end]
+                pos = end
+                empty_at = end if start == end else -1
+
+            # Keep one character before the next scan so boundaries still see it.
+            pos = max(pos, safe)
+            keep = max(pos - 1, 0)
+            buffer = buffer[keep:]
+            pos -= keep
+            empty_at -= keep
+
+        for start, end in spans(buffer, pos):
+            if start == end == empty_at:
+                continue
+            yield buffer[start:end]
@@ -8,6 +8,68 @@ from .pattern import STRlingError, Pattern, lit
 ########
 
 
+def _digit_range(start: int, end: int, method: str):
+    """
+    Returns the RegEx range between two digits, raising an error for `method` if they are invalid.
+    """
+    if 0 <= start <= end <= 9:
+        return f'{start}-{end}'
+
+    if start > end:
+        message = f"""
+        Method: simply.{method}(start, end)
+
+        The `start` integer must not be greater than the `end` integer.
+        """
+        raise STRlingError(message)
+
+    message = f"""
+    Method: simply.{method}(start, end)
+
+    The `start` and `end` integers must be single digits (0-9).
+    """
+    raise STRlingError(message)
+
+
+def _letter_range(start: str, end: str, method: str):
+    """
+    Returns the RegEx range between two letters, raising an error for `method` if they are invalid.
+    """
+    if len(start) == 1 and len(end) == 1 and start <= end and start.isalpha() and end.isalpha() and start.islower() == end.islower():
+        return f'{start}-{end}'
+
+    if not start.isalpha() or not end.isalpha():
+        message = f"""
+        Method: simply.{method}(start, end)
+
+        The `start` and `end` must be alphabetical characters.
+        """
+        raise STRlingError(message)
+
+    if len(start) != 1 or len(end) != 1:
+        message = f"""
+        Method: simply.{method}(start, end)
+
+        The `start` and `end` characters must be single letters.
+        """
+        raise STRlingError(message)
+
+    if start.islower() != end.islower():
+        message = f"""
+        Method: simply.{method}(start, end)
+
+        The `start` and `end` characters must be of the same case.
+        """
+        raise STRlingError(message)
+
+    message = f"""
+    Method: simply.{method}(start, end)
+
+    The `start` character must not be lexicographically greater than the `end` character.
+    """
+    raise STRlingError(message)
+
+
 def between(start: str, end: str, min_rep: int = None, max_rep: int = None):
     """
     Matches all characters within and including the start and end of a letter or number range.
@@ -35,7 +97,12 @@ def between(start: str, end: str, min_rep: int = None, max_rep: int = None):
     - Pattern: A Pattern object representing the character or digit range.
     """
 
-    if not (isinstance(start, str) and isinstance(end, str)) and not (isinstance(start, int) and isinstance(end, int)):
+    # Dispatch once on the argument types to the matching range builder
+    if type(start) is int and type(end) is int:
+        new_pattern = f'[{_digit_range(start, end, "between")}]'
+    elif type(start) is str and type(end) is str:
+        new_pattern = f'[{_letter_range(start, end, "between")}]'
+    else:
         message = """
         Method: simply.between(start, end)
 
@@ -43,60 +110,6 @@ def between(start: str, end: str, min_rep: int = None, max_rep: int = None):
         """
         raise STRlingError(message)
 
-    if isinstance(start, int):
-        if start > end:
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` integer must not be greater than the `end` integer.
-            """
-            raise STRlingError(message)
-
-        if not (0 <= start <= 9 and 0 <= end <= 9):
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` and `end` integers must be single digits (0-9).
-            """
-            raise STRlingError(message)
-
-        new_pattern = f'[{start}-{end}]'
-
-    if isinstance(start, str):
-        if not start.isalpha() or not end.isalpha():
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` and `end` must be alphabetical characters.
-            """
-            raise STRlingError(message)
-
-        if len(start) != 1 or len(end) != 1:
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` and `end` characters must be single letters.
-            """
-            raise STRlingError(message)
-
-        if start.islower() != end.islower():
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` and `end` characters must be of the same case.
-            """
-            raise STRlingError(message)
-
-        if start > end:
-            message = """
-            Method: simply.between(start, end)
-
-            The `start` character must not be lexicographically greater than the `end` character.
-            """
-            raise STRlingError(message)
-
-        new_pattern = f'[{start}-{end}]'
-
     return Pattern(new_pattern, custom_set=True)(min_rep, max_rep)
 
 
@@ -127,7 +140,12 @@ def not_between(start: str, end: str, min_rep: int = None, max_rep: int = None):
     - Pattern: A Pattern object representing the negated character or digit range.
     """
 
-    if not (isinstance(start, str) and isinstance(end, str)) and not (isinstance(start, int) and isinstance(end, int)):
+    # Dispatch once on the argument types to the matching range builder
+    if type(start) is int and type(end) is int:
+        new_pattern = f'[^{_digit_range(start, end, "not_between")}]'
+    elif type(start) is str and type(end) is str:
+        new_pattern = f'[^{_letter_range(start, end, "not_between")}]'
+    else:
         message = """
         Method: simply.not_between(start, end)
 
@@ -135,60 +153,6 @@ def not_between(start: str, end: str, min_rep: int = None, max_rep: int = None):
         """
         raise STRlingError(message)
 
-    if isinstance(start, int):
-        if start > end:
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` integer must not be greater than the `end` integer.
-            """
-            raise STRlingError(message)
-
-        if not (0 <= start <= 9 and 0 <= end <= 9):
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` and `end` integers must be single digits (0-9).
-            """
-            raise STRlingError(message)
-
-        new_pattern = f'[^{start}-{end}]'
-
-    if isinstance(start, str):
-        if not start.isalpha() or not end.isalpha():
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` and `end` must be alphabetical characters.
-            """
-            raise STRlingError(message)
-
-        if len(start) != 1 or len(end) != 1:
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` and `end` characters must be single letters.
-            """
-            raise STRlingError(message)
-
-        if start.islower() != end.islower():
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` and `end` characters must be of the same case.
-            """
-            raise STRlingError(message)
-
-        if start > end:
-            message = """
-            Method: simply.not_between(start, end)
-
-            The `start` character must not be lexicographically greater than the `end` character.
-            """
-            raise STRlingError(message)
-
-        new_pattern = f'[^{start}-{end}]'
-
     return Pattern(new_pattern, custom_set=True, negated=True)(min_rep, max_rep)
 
 
@@ -234,9 +198,10 @@ def in_chars(*patterns):
         """
         raise STRlingError(message)
 
-    joined = r''
+    parts = []
     for pattern in clean_patterns:
-        if len(str(pattern)) > 1 and str(pattern)[-1] == '}' and str(pattern)[-2] != "\\":
+        text = str(pattern)
+        if len(text) > 1 and text[-1] == '}' and text[-2] != "\\":
             message = """
             Method: simply.in_chars(*patterns)
 
@@ -255,10 +220,11 @@ def in_chars(*patterns):
                 """
                 raise STRlingError(message)
             else:
-                joined += str(pattern)[1:-1]  # [pattern] => pattern
+                parts.append(text[1:-1])  # [pattern] => pattern
         else:
-            joined += str(pattern)
+            parts.append(text)
 
+    joined = ''.join(parts)
     new_pattern = f'[{joined}]'
     return Pattern(new_pattern, custom_set=True)
 
@@ -308,9 +274,10 @@ def not_in_chars(*patterns):
         """
         raise STRlingError(message)
 
-    joined = r''
+    parts = []
     for pattern in clean_patterns:
-        if len(str(pattern)) > 1 and str(pattern)[-1] == '}' and str(pattern)[-2] != "\\":
+        text = str(pattern)
+        if len(text) > 1 and text[-1] == '}' and text[-2] != "\\":
             message = """
             Method: simply.not_in_chars(*patterns)
 
@@ -320,11 +287,12 @@ def not_in_chars(*patterns):
 
         if pattern.custom_set:
             if pattern.negated:
-                joined += str(pattern)[2:-1]  # [^pattern] => pattern
+                parts.append(text[2:-1])  # [^pattern] => pattern
             else:
-                joined += str(pattern)[1:-1]  # [pattern] => pattern
+                parts.append(text[1:-1])  # [pattern] => pattern
         else:
-            joined += str(pattern)
+            parts.append(text)
 
+    joined = ''.join(parts)
     new_pattern = f'[^{joined}]'
     return Pattern(new_pattern, custom_set=True, negated=True)
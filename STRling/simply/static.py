@@ -2,6 +2,10 @@
 from .pattern import Pattern, lit
 
 
+# Escaped once at import; the set never changes between calls.
+_special = str(lit("""!"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"""))
+
+
 
 ############################
 # Custom Char Sets
@@ -9,7 +13,7 @@ from .pattern import Pattern, lit
 
 def special_char(min_rep: int = None, max_rep: int = None):
     """
-    Matches any special character. => !"#$%&'()*+,-./:;<=>?@[\]^_`{|}~
+    Matches any special character. => !"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~
 
     Parameters: (min_rep/exact_rep, max_rep)
     - min_rep (optional): Specifies the minimum number of characters to match.
@@ -22,13 +26,12 @@ def special_char(min_rep: int = None, max_rep: int = None):
     Returns:
     - An instance of the Pattern class.
     """
-    special = lit("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~""")
-    return Pattern(f'[{str(special)}]', custom_set=True)(min_rep, max_rep)
+    return Pattern(f'[{_special}]', custom_set=True)(min_rep, max_rep)
 
 
 def not_special_char(min_rep: int = None, max_rep: int = None):
     """
-    Matches anything but a special character. => !"#$%&'()*+,-./:;<=>?@[\]^_`{|}~
+    Matches anything but a special character. => !"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~
 
     Parameters: (min_rep/exact_rep, max_rep)
     - min_rep (optional): Specifies the minimum number of characters to match.
@@ -41,8 +44,7 @@ def not_special_char(min_rep: int = None, max_rep: int = None):
     Returns:
     - An instance of the Pattern class.
     """
-    special = lit("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~""")
-    return Pattern(f'[^{str(special)}]', custom_set=True, negated=True)(min_rep, max_rep)
+    return Pattern(f'[^{_special}]', custom_set=True, negated=True)(min_rep, max_rep)
 
 
 def word_char(min_rep: int = None, max_rep: int = None):
@@ -0,0 +1,142 @@
+import random
+import re
+
+import pytest
+
+from STRling import simply as s
+from STRling.simply.engine import EngineUnsupported, LazyDFA, NFA, NFASimulator, compile_dfa, parse
+
+
+def spans(regex, text, pos=0):
+    return [match.span() for match in re.compile(regex).finditer(text, pos)]
+
+
+# Patterns where the leftmost match of `re` is also the longest one
+SAME_AS_RE = [
+    r'\d+',
+    r'[a-z]+\d',
+    r'a*',
+    r'(?:ab)+|c',
+    r'x?',
+    r'\w+@\w+\.[a-z]{2,3}',
+    r'^\d{3}$',
+    r'^a*',
+    r'a*$',
+    r'\d\Z',
+    r'$',
+    r'^',
+    r'\bfoo\w*',
+    r'\Bo+',
+    r'\b',
+    r'\B',
+    r'a*\b',
+    r'(?:a|b)*c{2}',
+    r'$^',
+    r'\Z\A',
+    r'(?:a|$)^',
+]
+
+TEXTS = ['', 'a', 'aa', 'ab12 cc\n', 'foo food xfoo\n', '123', '123\n', 'x\ny', 'me@mail.com 12ab', 'ababcc', '\n']
+
+
+@pytest.mark.parametrize('regex', SAME_AS_RE)
+def test_finditer_matches_re(regex):
+    dfa = compile_dfa(regex)
+    for text in TEXTS:
+        for pos in range(len(text) + 1):
+            assert list(dfa.finditer(text, pos)) == spans(regex, text, pos), (text, pos)
+
+
+@pytest.mark.parametrize('regex', SAME_AS_RE)
+def test_finditer_matches_re_on_random_text(regex):
+    dfa = compile_dfa(regex)
+    rng = random.Random(regex)
+    for _ in range(200):
+        text = ''.join(rng.choice('ab c1\n_fo@.') for _ in range(rng.randint(0, 20)))
+        assert list(dfa.finditer(text)) == spans(regex, text), text
+
+
+def test_leftmost_longest():
+    # `re` takes the first alternative that succeeds, the DFA the longest match at the leftmost start
+    assert spans(r'a|ab', 'xab') == [(1, 2)]
+    assert list(compile_dfa(r'a|ab').finditer('xab')) == [(1, 3)]
+    assert list(compile_dfa(r'a*b|a').finditer('aaa')) == [(0, 1), (1, 2), (2, 3)]
+    assert list(compile_dfa(r'b|ab*').finditer('abbb b')) == [(0, 4), (5, 6)]
+
+
+def test_match_returns_longest_end():
+    dfa = compile_dfa(r'a|ab|abc')
+    assert dfa.match('abcd') == 3
+    assert dfa.match('abcd', 1) == -1
+    assert compile_dfa(r'^a').match('aa', 1) == -1
+
+
+def test_search():
+    dfa = compile_dfa(r'[a-z]+\d')
+    assert dfa.search('aaaa aa1') == (5, 8)
+    assert dfa.search('aaaa aa1', 6) == (6, 8)
+    assert dfa.search('aaaa') is None
+
+
+def test_end_assertions_before_final_newline():
+    assert list(compile_dfa(r'\d$').finditer('12\n')) == spans(r'\d$', '12\n') == [(1, 2)]
+    assert list(compile_dfa(r'\d\Z').finditer('12\n')) == spans(r'\d\Z', '12\n') == []
+    assert list(compile_dfa(r'$').finditer('a\n')) == spans(r'$', 'a\n') == [(1, 1), (2, 2)]
+
+
+def test_end_anchor_before_begin_anchor():
+    # Both anchors hold at the start of an empty text, and `$` also holds before a lone newline
+    pattern = s.merge(s.end(), s.start())
+    assert pattern.findall('', engine='dfa') == pattern.findall('') == ['']
+    assert pattern.findall('\n', engine='dfa') == pattern.findall('\n') == ['']
+    nfa = NFA(parse(r'$^'))
+    lazy = LazyDFA(nfa, nfa.alphabet())
+    assert list(lazy.finditer('')) == [(0, 0)]
+    assert lazy.match('') == compile_dfa(r'$^').match('') == 0
+
+
+def test_empty_matches():
+    dfa = compile_dfa(r'a*')
+    assert list(dfa.finditer('baab')) == spans(r'a*', 'baab') == [(0, 0), (1, 3), (3, 3), (4, 4)]
+    assert list(dfa.finditer('')) == [(0, 0)]
+
+
+def test_boundaries_on_empty_text():
+    assert list(compile_dfa(r'\B').finditer('')) == spans(r'\B', '') == []
+    assert list(compile_dfa(r'\b').finditer('')) == spans(r'\b', '') == []
+    assert isinstance(compile_dfa(r'\B'), NFASimulator)
+
+
+def test_lazy_dfa_with_small_cache():
+    regex = r'(?:a|b)*a(?:a|b){12}'
+    nfa = NFA(parse(regex))
+    lazy = LazyDFA(nfa, nfa.alphabet(), cache_bytes=2000)
+    rng = random.Random(1)
+    for _ in range(100):
+        text = ''.join(rng.choice('ab') for _ in range(rng.randint(0, 40)))
+        assert list(lazy.finditer(text)) == spans(regex, text), text
+
+
+def test_large_patterns_are_lazy():
+    assert isinstance(compile_dfa(r'\w*a\w{20}'), LazyDFA)
+
+
+def test_search_reads_unmatched_text_once():
+    # Retrying the match at every position would take quadratic time here
+    pattern = s.merge(s.letter(1, 0), s.digit())
+    assert pattern.findall('a' * 200000, engine='dfa') == []
+    assert list(compile_dfa(r'a*b').finditer('a' * 200000)) == []
+
+
+def test_counted_repetition_past_the_candidate_limit():
+    # Every position starts a candidate with its own count, more than a search follows at once
+    for regex in (r'\d{20}', r'\d{6000}', r'\b\d{20}'):
+        dfa = compile_dfa(regex)
+        for text in ('1' * 30 + ' ' + '1' * 19, '1' * 7000 + ' ' + '1' * 45):
+            assert list(dfa.finditer(text)) == spans(regex, text)
+
+
+def test_unsupported():
+    for regex in (r'(a)\1', r'a(?=b)', r'a*?', r'(?i:a)'):
+        with pytest.raises(EngineUnsupported):
+            compile_dfa(regex)
@@ -0,0 +1,99 @@
+import pytest
+
+from STRling import simply as s
+
+
+def test_finditer():
+    matches = list(s.digit(3).finditer('123 and 4567'))
+    assert [match.group() for match in matches] == ['123', '456']
+    assert [match.span() for match in matches] == [(0, 3), (8, 11)]
+
+
+def test_first_match():
+    match = s.digit(3).first_match('ab 1234 567')
+    assert match.group() == '123'
+    assert match.span() == (3, 6)
+    assert s.digit(3).first_match('ab') is None
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+def test_findall_iter(engine):
+    matches = s.digit(3).findall_iter('123 and 456', engine=engine)
+    assert next(matches) == '123'
+    assert list(matches) == ['456']
+
+
+@pytest.mark.parametrize('method', ['findall', 'findall_iter', 'stream'])
+def test_invalid_engine(method):
+    with pytest.raises(s.STRlingError) as error:
+        getattr(s.digit(3), method)('123', engine='regex')
+    assert f'Pattern.{method}(' in error.value.message
+    assert "must be either 're' or 'dfa'" in error.value.message
+
+
+def test_to_dfa():
+    dfa = s.digit(3).to_dfa()
+    assert list(dfa.finditer('123 and 456')) == [(0, 3), (8, 11)]
+    assert s.digit(3).to_dfa() is dfa
+
+
+def test_to_dfa_unsupported_pattern():
+    pattern = s.merge(s.letter(), s.ahead(s.digit()))
+    with pytest.raises(s.STRlingError) as error:
+        pattern.to_dfa()
+    assert 'Pattern.to_dfa()' in error.value.message
+    assert 'lookarounds' in error.value.message
+    # findall falls back to `re` for the patterns the DFA cannot represent
+    assert pattern.findall('a1 b2 c', engine='dfa') == pattern.findall('a1 b2 c') == ['a', 'b']
+
+
+def splits(text):
+    """
+    Yields every way to cut the text into three chunks, including empty ones.
+    """
+    for first in range(len(text) + 1):
+        for second in range(first, len(text) + 1):
+            yield [text[:first], text[first:second], text[second:]]
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+def test_stream_match_across_chunks(engine):
+    pattern = s.merge('E', s.digit(4))
+    assert list(pattern.stream(['xE12', '34y'], engine=engine)) == ['E1234']
+    assert list(pattern.stream(['E1', '2', '3', '4E', '5678'], engine=engine)) == ['E1234', 'E5678']
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+@pytest.mark.parametrize('pattern', [
+    s.merge('E', s.digit(4)),
+    s.digit(0, 1),
+    s.merge(s.bound(), s.digit()),
+    s.merge(s.digit(2), s.end()),
+    s.any_of('ab', 'a'),
+])
+def test_stream_matches_joined_text(pattern, engine):
+    text = 'xE1234 a12 3ab 56'
+    for chunks in splits(text):
+        assert list(pattern.stream(chunks, engine=engine)) == pattern.findall(text, engine=engine), chunks
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+def test_stream_empty_matches(engine):
+    # Empty matches at a chunk edge are yielded once
+    pattern = s.digit(0, 1)
+    chunks = ['a1', '', '2b', '3']
+    assert list(pattern.stream(chunks, engine=engine)) == pattern.findall('a12b3') == ['', '1', '2', '', '3', '']
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+def test_stream_boundary_at_chunk_edge(engine):
+    # The carried character keeps `2` from looking like the start of a word
+    pattern = s.merge(s.bound(), s.digit())
+    assert list(pattern.stream(['a1', '2 3'], engine=engine)) == ['3']
+    assert list(pattern.stream(['ab ', '1'], engine=engine)) == ['1']
+
+
+@pytest.mark.parametrize('engine', ['re', 'dfa'])
+def test_stream_unbounded_patterns_match_within_each_chunk(engine):
+    assert list(s.digit(1, 0).stream(['12', '34'], engine=engine)) == ['12', '34']
+    assert list(s.merge(s.start(), s.digit(1, 0)).stream(['12a', '34'], engine=engine)) == ['12', '34']